@@ -3,10 +3,17 @@ import random
 import sys
 import math
 import asyncio
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional (and unavailable in the browser build)
+    njit = None
 
 # --- Configuration ---
 WIDTH, HEIGHT = 900, 1020
 FPS = 60
+IS_WEB = sys.platform == "emscripten"
 
 # Colors
 BG_COLOR = (25, 25, 35)
@@ -79,142 +86,408 @@ def bin_center_x(index):
     return CENTER_X + (index - NUM_ROWS / 2.0) * BIN_WIDTH
 
 
+# Lookup tables for building ball paths: PEG_X[row, col], PEG_Y[row], BIN_X[bin]
+PEG_X = np.array([[peg_pos(row, col)[0] for col in range(NUM_ROWS + 1)] for row in range(NUM_ROWS)])
+PEG_Y = np.array([peg_pos(row, 0)[1] for row in range(NUM_ROWS)])
+BIN_X = np.array([bin_center_x(i) for i in range(NUM_BINS)])
+ROWS = np.arange(NUM_ROWS)
+
+# Every point a ball path can visit, as NODE_X[step, node] and NODE_Y[step].
+# Step 0 is the drop point, step row + 1 passes the peg in column node // 2
+# of that row on its left (even node) or right (odd node), and the last step
+# is the center of bin ``node``. All points of one step share the same y.
+PATH_LEN = NUM_ROWS + 2
+NODE_X = np.full((PATH_LEN, 2 * NUM_BINS), float(CENTER_X))
+NODE_X[1:-1, 0::2] = PEG_X - (PEG_RADIUS + BALL_RADIUS + 2)
+NODE_X[1:-1, 1::2] = PEG_X + (PEG_RADIUS + BALL_RADIUS + 2)
+NODE_X[-1, :NUM_BINS] = BIN_X
+NODE_Y = np.concatenate(([BOARD_TOP - 20], PEG_Y + PEG_RADIUS + BALL_RADIUS, [BIN_TOP + 15])).astype(float)
+
+# Integer pixel positions for drawing: peg centers, bin centers and bin edges
+PEGS = tuple(
+    (int(px), int(py))
+    for row in range(NUM_ROWS) for col in range(row + 1)
+    for px, py in [peg_pos(row, col)]
+)
+BIN_CENTERS = tuple(int(bin_center_x(i)) for i in range(NUM_BINS))
+BIN_EDGES = tuple(int(bin_center_x(0) - BIN_WIDTH / 2 + i * BIN_WIDTH) for i in range(NUM_BINS + 1))
+
+# Smoothstep easing t*t*(3 - 2t) tabulated over [0, 1], indexed by int(t * EASE_STEPS)
+EASE_STEPS = 1023
+EASE_LUT = np.array([t * t * (3 - 2 * t) for t in np.linspace(0.0, 1.0, EASE_STEPS + 1)])
+
+
+# Shared generator for the per-ball random draws, which are made in batches
+rng = np.random.default_rng()
+
+_ball_sprites = {}
+
+
+def ball_sprite(color, radius=BALL_RADIUS):
+    """A ball of the given colour pre-rendered onto a small transparent surface.
+
+    Blit it at (x - radius, y - radius) to center it on (x, y).
+    """
+    key = (color, radius)
+    sprite = _ball_sprites.get(key)
+    if sprite is None:
+        size = 2 * radius + 1
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        sprite = sprite.convert_alpha()
+        _ball_sprites[key] = sprite
+    return sprite
+
+
+_text_cache = {}
+
+
+def render_text(text, font, color):
+    """font.render() with antialiasing, cached by text, font and colour."""
+    key = (text, id(font), color)
+    surf = _text_cache.get(key)
+    if surf is None:
+        surf = font.render(text, True, color).convert_alpha()
+        _text_cache[key] = surf
+    return surf
+
+
+def blit_many(surface, blit_sequence):
+    """Blit a sequence of (source, dest) pairs in a single call."""
+    if hasattr(surface, "fblits"):  # pygame-ce
+        surface.fblits(blit_sequence)
+    else:
+        surface.blits(blit_sequence, doreturn=False)
+
+
 def generate_choices(mode, bin_counts=None):
-    choices = []
+    """Pick a ball's way through the pegs.
+
+    Returns the choices packed into an int: bit ``row`` is set when the ball
+    goes right on that row, so the number of set bits is its bin.
+    """
+    bits = 0
     if mode == MODE_GAUSS:
-        for _ in range(NUM_ROWS):
-            choices.append(random.randint(0, 1))
+        # One draw gives all NUM_ROWS fair coin flips at once
+        bits = random.getrandbits(NUM_ROWS)
     elif mode == MODE_PARETO:
+        us = rng.random(NUM_ROWS).tolist()
         num_lefts = 0
         for row in range(NUM_ROWS):
             n = max(num_lefts, 1)
             p_right = 0.5 / n
-            if random.random() < p_right:
-                choices.append(1)
+            if us[row] < p_right:
+                bits |= 1 << row
             else:
-                choices.append(0)
                 num_lefts += 1
     elif mode == MODE_COMPETITION:
+        # suffix[i] is the number of balls in bins i and to the right of it
+        suffix = [0] * (NUM_BINS + 1)
+        if bin_counts:
+            s = 0
+            for i in range(NUM_BINS - 1, -1, -1):
+                s += bin_counts[i]
+                suffix[i] = s
+        us = rng.random(NUM_ROWS).tolist()
         num_rights = 0
         for row in range(NUM_ROWS):
-            k = sum(bin_counts[num_rights + 1:]) if bin_counts else 0
+            k = suffix[num_rights + 1]
             if k > 0:
                 p_right = min(0.5 / k, 0.5)
             else:
                 p_right = 0.5
-            if random.random() < p_right:
-                choices.append(1)
+            if us[row] < p_right:
+                bits |= 1 << row
                 num_rights += 1
-            else:
-                choices.append(0)
-    return choices
-
-
-class Ball:
-    def __init__(self, mode, bin_counts=None):
-        self.choices = generate_choices(mode, bin_counts)
-        self.final_bin = sum(self.choices)
-        self.path = self._build_path()
-        self.segment = 0
-        self.t = 0.0
-        self.speed = random.uniform(0.028, 0.042)
-        self.x, self.y = self.path[0]
-        self.landed = False
+    return bits
+
+
+def _step_balls(t, speed, segment, x, y, nodes, node_x, node_y, landed, n, ease, done):
+    """Advance the first ``n`` balls by one frame (compiled with numba).
+
+    The indices of the balls that land are written to ``done``; returns how many.
+    """
+    last = nodes.shape[1] - 1
+    num_done = 0
+    for i in range(n):
+        if landed[i]:
+            continue
+        ti = t[i] + speed[i]
+        if ti >= 1.0:
+            ti -= 1.0
+            segment[i] += 1
+            if segment[i] >= last:
+                t[i] = ti
+                landed[i] = True
+                x[i] = node_x[last, nodes[i, last]]
+                y[i] = node_y[last]
+                done[num_done] = i
+                num_done += 1
+                continue
+        t[i] = ti
+        s = segment[i]
+        p0x, p0y = node_x[s, nodes[i, s]], node_y[s]
+        p1x, p1y = node_x[s + 1, nodes[i, s + 1]], node_y[s + 1]
+        te = ease[int(ti * EASE_STEPS)]
+        x[i] = p0x + (p1x - p0x) * te
+        y[i] = p0y + (p1y - p0y) * te
+    return num_done
+
+
+_step_balls = njit(cache=True)(_step_balls) if njit is not None else None
+
+
+class BallSystem:
+    """All balls on the board, stored as parallel numpy arrays.
+
+    Ball ``i`` is the ``i``-th ball spawned; its path has PATH_LEN points
+    (start, one per peg row, bin), stored as one byte per point indexing
+    NODE_X, and it moves along one segment at a time.
+    The arrays are allocated once for ``capacity`` balls and reused across
+    boards via reset().
+    """
+
+    __slots__ = ('nodes', 'segment', 't', 'speed', 'x', 'y', 'landed',
+                 'final_bin', 'color', 'sprite', 'count', 'done')
+
+    def __init__(self, capacity):
+        self.nodes = np.zeros((capacity, PATH_LEN), dtype=np.uint8)
+        self.segment = np.zeros(capacity, dtype=np.intp)
+        self.t = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.landed = np.zeros(capacity, dtype=bool)
+        self.final_bin = [0] * capacity
+        self.color = [None] * capacity
+        self.sprite = [None] * capacity
+        self.count = 0
+        # Output buffer for the numba kernel's newly landed indices
+        self.done = np.zeros(capacity, dtype=np.intp)
+
+    def reset(self):
+        # spawn() overwrites every field of a slot, so only the count matters
+        self.count = 0
+
+    def spawn(self, mode, bin_counts=None):
+        i = self.count
+        bits = generate_choices(mode, bin_counts)
+        self.final_bin[i] = bits.bit_count()
+        self._build_path(i, bits)
+        # Speed, palette pick and RGB jitter all come from one batch
+        u_speed, u_pick, *u_jitter = rng.random(5).tolist()
+        self.segment[i] = 0
+        self.t[i] = 0.0
+        self.speed[i] = 0.028 + (0.042 - 0.028) * u_speed
+        self.x[i] = NODE_X[0, 0]
+        self.y[i] = NODE_Y[0]
+        self.landed[i] = False
         palettes = {MODE_GAUSS: PALETTE_GAUSS, MODE_PARETO: PALETTE_PARETO, MODE_COMPETITION: PALETTE_COMPETITION}
         palette = palettes[mode]
-        self.color = random.choice(palette)
-        self.color = tuple(
-            max(0, min(255, c + random.randint(-15, 15))) for c in self.color
+        color = palette[int(u_pick * len(palette))]
+        # Jitter each channel by -15..15, then snap to 5 bits per channel so
+        # only a few hundred sprites are ever made
+        self.color[i] = tuple(
+            max(0, min(255, c + int(u * 31) - 15)) & 0xF8 | 4 for c, u in zip(color, u_jitter)
         )
-
-    def _build_path(self):
-        path = [(CENTER_X, BOARD_TOP - 20)]
-        col = 0
-        for row in range(NUM_ROWS):
-            px, py = peg_pos(row, col)
-            d = self.choices[row]
-            offset_x = (-1 if d == 0 else 1) * (PEG_RADIUS + BALL_RADIUS + 2)
-            path.append((px + offset_x, py + PEG_RADIUS + BALL_RADIUS))
-            col += d
-        bx = bin_center_x(self.final_bin)
-        path.append((bx, BIN_TOP + 15))
-        return path
+        self.sprite[i] = ball_sprite(self.color[i])
+        self.count += 1
+
+    def _build_path(self, i, bits):
+        choices = (bits >> ROWS) & 1
+        # Column of the peg hit on each row: the number of rights taken before it
+        cols = np.concatenate(([0], np.cumsum(choices)))[:NUM_ROWS]
+        nodes = self.nodes[i]
+        nodes[0] = 0
+        nodes[1:-1] = cols * 2 + choices
+        nodes[-1] = self.final_bin[i]
+
+    def active(self):
+        """Indices of the balls still falling."""
+        return np.flatnonzero(~self.landed[:self.count])
 
     def update(self):
-        if self.landed:
-            return
-        self.t += self.speed
-        if self.t >= 1.0:
-            self.t -= 1.0
-            self.segment += 1
-            if self.segment >= len(self.path) - 1:
-                self.landed = True
-                self.x, self.y = self.path[-1]
-                return
-        p0 = self.path[self.segment]
-        p1 = self.path[self.segment + 1]
-        t_ease = self.t * self.t * (3 - 2 * self.t)
-        self.x = p0[0] + (p1[0] - p0[0]) * t_ease
-        self.y = p0[1] + (p1[1] - p0[1]) * t_ease
+        """Advance every falling ball by one frame.
+
+        Returns the indices of the balls that landed during this frame.
+        """
+        n = self.count
+        if _step_balls is not None:
+            num_done = _step_balls(self.t, self.speed, self.segment, self.x, self.y,
+                                   self.nodes, NODE_X, NODE_Y, self.landed, n, EASE_LUT, self.done)
+            return self.done[:num_done]
+
+        t = self.t[:n]
+        segment = self.segment[:n]
+        landed = self.landed[:n]
+
+        # Masks are applied arithmetically rather than through boolean
+        # indexing, which keeps the number of temporaries down. Landed balls
+        # get zero speed, so their t stays below 1 and they never advance.
+        t += self.speed[:n] * ~landed
+        advance = t >= 1.0
+        t -= advance
+        segment += advance
+        just_landed = advance & (segment >= PATH_LEN - 1)
+        landed |= just_landed
+
+        # Flat indices into NODE_X of each falling ball's current segment ends
+        idx = np.flatnonzero(~landed)
+        seg = segment[idx]
+        p = idx * PATH_LEN + seg
+        nodes = self.nodes.ravel()
+        node_x = NODE_X.ravel()
+        stride = NODE_X.shape[1]
+        n0 = seg * stride + nodes[p]
+        n1 = (seg + 1) * stride + nodes[p + 1]
+        x0 = node_x[n0]
+        y0 = NODE_Y[seg]
+        te = EASE_LUT[(t[idx] * EASE_STEPS).astype(np.intp)]
+        self.x[idx] = x0 + (node_x[n1] - x0) * te
+        self.y[idx] = y0 + (NODE_Y[seg + 1] - y0) * te
+
+        done = np.flatnonzero(just_landed)
+        self.x[done] = NODE_X[-1, self.nodes[done, -1]]
+        self.y[done] = NODE_Y[-1]
+        return done
 
     def draw(self, surface):
-        pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), BALL_RADIUS)
+        """Draw every falling ball and return the screen rects they cover."""
+        idx = self.active()
+        xs = (self.x[idx].astype(int) - BALL_RADIUS).tolist()
+        ys = (self.y[idx].astype(int) - BALL_RADIUS).tolist()
+        sprite = self.sprite
+        blit_many(surface, [(sprite[i], (x, y)) for i, x, y in zip(idx.tolist(), xs, ys)])
+        size = 2 * BALL_RADIUS + 1
+        return [pygame.Rect(x, y, size, size) for x, y in zip(xs, ys)]
 
 
 class Button:
+    __slots__ = ('rect', 'x0', 'y0', 'x1', 'y1', 'text', 'font', 'color', 'accent')
+
     def __init__(self, x, y, w, h, text, font, color=WHITE, accent=None):
         self.rect = pygame.Rect(x, y, w, h)
+        # Plain int bounds for hit tests, same as rect.collidepoint
+        self.x0, self.y0, self.x1, self.y1 = x, y, x + w, y + h
         self.text = text
         self.font = font
         self.color = color
         self.accent = accent
 
     def draw(self, surface, mouse_pos):
-        hovered = self.rect.collidepoint(mouse_pos)
-        bg = BTN_HOVER if hovered else BTN_BG
+        bg = BTN_HOVER if self.hovered(mouse_pos) else BTN_BG
         pygame.draw.rect(surface, bg, self.rect, border_radius=8)
         pygame.draw.rect(surface, BTN_BORDER, self.rect, 1, border_radius=8)
         txt_color = self.accent if self.accent else self.color
-        txt = self.font.render(self.text, True, txt_color)
+        txt = render_text(self.text, self.font, txt_color)
         surface.blit(txt, (
             self.rect.centerx - txt.get_width() // 2,
             self.rect.centery - txt.get_height() // 2,
         ))
 
+    def hovered(self, pos):
+        mx, my = pos
+        return self.x0 <= mx < self.x1 and self.y0 <= my < self.y1
+
     def clicked(self, pos):
-        return self.rect.collidepoint(pos)
+        return self.hovered(pos)
+
+
+# Unit vectors for the dots around a coin's rim, every 30 degrees
+_RIM_OFFSETS = tuple(
+    (math.cos(math.radians(angle_deg)), math.sin(math.radians(angle_deg)))
+    for angle_deg in range(0, 360, 30)
+)
+
+_coin_rims = {}
+_coin_font = None
+
+
+def get_coin_rim(radius, border_color):
+    """The dots around a coin's rim on a transparent surface, centered like the coin."""
+    key = (radius, border_color)
+    rim = _coin_rims.get(key)
+    if rim is None:
+        size = 2 * radius + 1
+        rim = pygame.Surface((size, size), pygame.SRCALPHA)
+        for cos_a, sin_a in _RIM_OFFSETS:
+            dx = int(cos_a * (radius - 4))
+            dy = int(sin_a * (radius - 4))
+            rim.set_at((radius + dx, radius + dy), border_color)
+        _coin_rims[key] = rim
+    return rim
+
+
+def get_coin_font():
+    # SysFont looks the font up on disk, so only do it once
+    global _coin_font
+    if _coin_font is None:
+        _coin_font = pygame.font.SysFont("Helvetica", 14, bold=True)
+    return _coin_font
 
 
 def draw_pixel_coin(surface, cx, cy, radius, label, color, border_color, text_color):
     pygame.draw.circle(surface, border_color, (cx, cy), radius)
     pygame.draw.circle(surface, color, (cx, cy), radius - 3)
     pygame.draw.circle(surface, border_color, (cx, cy), radius - 5, 1)
-    for angle_deg in range(0, 360, 30):
-        rad = math.radians(angle_deg)
-        dx = int(math.cos(rad) * (radius - 4))
-        dy = int(math.sin(rad) * (radius - 4))
-        surface.set_at((cx + dx, cy + dy), border_color)
-    coin_font = pygame.font.SysFont("Helvetica", 14, bold=True)
-    txt = coin_font.render(label, True, text_color)
+    surface.blit(get_coin_rim(radius, border_color), (cx - radius, cy - radius))
+    txt = get_coin_font().render(label, True, text_color)
     surface.blit(txt, (cx - txt.get_width() // 2, cy - txt.get_height() // 2))
 
 
+def render_pixel_coin(radius, label, color, border_color, text_color):
+    """A coin drawn once on a BG_COLOR square, to be blitted centered on (cx, cy)."""
+    size = 2 * radius + 1
+    coin = pygame.Surface((size, size)).convert()
+    coin.fill(BG_COLOR)
+    draw_pixel_coin(coin, radius, radius, radius, label, color, border_color, text_color)
+    return coin
+
+
 async def main():
     pygame.init()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Boards of Destiny")
     clock = pygame.time.Clock()
 
+    # Only queue the events the game handles; everything else (mouse motion,
+    # window and text input events) is dropped by SDL before it reaches Python
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN,
+                              pygame.KEYDOWN, pygame.VIDEOEXPOSE])
+
     font = pygame.font.SysFont("Helvetica", 21)
     title_font = pygame.font.SysFont("Helvetica", 36, bold=True)
     small_font = pygame.font.SysFont("Helvetica", 17)
     btn_font = pygame.font.SysFont("Helvetica", 20, bold=True)
 
-    # Pre-compute peg positions
-    pegs = []
-    for row in range(NUM_ROWS):
-        for col in range(row + 1):
-            pegs.append(peg_pos(row, col))
+    # The pegs, bins and title never change, so render them once into a background
+    board_bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+    board_bg.fill(BG_COLOR)
+
+    # Pegs: all identical, so draw one and stamp it at every position
+    peg_size = 2 * PEG_RADIUS + 1
+    peg_surf = pygame.Surface((peg_size, peg_size), pygame.SRCALPHA)
+    pygame.draw.circle(peg_surf, PEG_COLOR, (PEG_RADIUS, PEG_RADIUS), PEG_RADIUS)
+    pygame.draw.circle(peg_surf, PEG_HIGHLIGHT, (PEG_RADIUS - 1, PEG_RADIUS - 1), max(1, PEG_RADIUS // 2))
+    peg_surf = peg_surf.convert_alpha(screen)
+    peg_blit_positions = [(px - PEG_RADIUS, py - PEG_RADIUS) for (px, py) in PEGS]
+    blit_many(board_bg, [(peg_surf, pos) for pos in peg_blit_positions])
+
+    # Bin dividers
+    for x in BIN_EDGES:
+        pygame.draw.line(board_bg, BIN_BORDER_COLOR, (x, BIN_TOP), (x, BIN_BOTTOM), 2)
+
+    # Bin bottom
+    left_x, right_x = BIN_EDGES[0], BIN_EDGES[-1]
+    pygame.draw.line(board_bg, BIN_BORDER_COLOR, (left_x, BIN_BOTTOM), (right_x, BIN_BOTTOM), 2)
+
+    # Title
+    title_surf = title_font.render("Boards of Destiny", True, WHITE)
+    board_bg.blit(title_surf, (CENTER_X - title_surf.get_width() // 2, 10))
+
+    # board_bg plus the current board's mode label, rebuilt for every board
+    background = pygame.Surface((WIDTH, HEIGHT)).convert()
 
     # Mode selection buttons
     btn_w, btn_h = 690, 90
@@ -239,15 +512,82 @@ async def main():
         MODE_COMPETITION: 'Chance of "success" depends on being ahead or behind competitors',
     }
 
+    # Text that never changes is rendered once up front
+    prompt_surf = font.render("Choose a mode:", True, WHITE)
+    desc_surfs = {m: small_font.render(mode_descs[m], True, DIM_TEXT_COLOR) for _, m in mode_buttons}
+    pause_surf = title_font.render("PAUSED", True, (255, 255, 100))
+
+    # The menu's pixel art coins never change, so they are drawn only once
+    coin_y = HEIGHT - 90
+    coin_r = 42
+    coins = [
+        (render_pixel_coin(coin_r, "SUCCESS", (220, 190, 60), (170, 140, 30), (100, 75, 10)),
+         (CENTER_X - 80 - coin_r, coin_y - coin_r)),
+        (render_pixel_coin(coin_r, "FAILURE", (160, 170, 185), (100, 110, 125), (50, 55, 65)),
+         (CENTER_X + 80 - coin_r, coin_y - coin_r)),
+    ]
+
+    # Landed balls never move, so each one is stamped once into this layer.
+    # It spans the bins horizontally and reaches up to the top of the window
+    # because tall stacks can rise above BIN_TOP.
+    landed_surface = pygame.Surface((right_x - left_x, BIN_BOTTOM), pygame.SRCALPHA).convert_alpha()
+
+    # Bin count labels only change when a ball lands, so they also get their
+    # own layer and only the label of a bin whose count changed is redrawn
+    label_surf = pygame.Surface((WIDTH, small_font.get_height()), pygame.SRCALPHA).convert_alpha()
+
+    balls = BallSystem(MAX_BALLS)
+    kernel_ready = False
+
+    # Kept up to date from MOUSEMOTION events rather than polled every frame
+    mouse_pos = pygame.mouse.get_pos()
+
     while True:
         # --- Mode selection screen ---
         mode = None
+        drawn_hover = None
         while mode is None:
-            mouse_pos = pygame.mouse.get_pos()
-            for event in pygame.event.get():
+            # Nothing on this screen animates, so it is only redrawn when the
+            # hovered button changes (or the window needs repainting)
+            hover = tuple(btn.hovered(mouse_pos) for btn, _ in mode_buttons)
+            if hover != drawn_hover:
+                drawn_hover = hover
+                screen.fill(BG_COLOR)
+
+                screen.blit(title_surf, (CENTER_X - title_surf.get_width() // 2, 60))
+                screen.blit(prompt_surf, (CENTER_X - prompt_surf.get_width() // 2, 120))
+
+                for btn, m in mode_buttons:
+                    btn.draw(screen, mouse_pos)
+                    desc = desc_surfs[m]
+                    screen.blit(desc, (CENTER_X - desc.get_width() // 2, btn.rect.bottom + 6))
+
+                # Pixel art coins
+                blit_many(screen, coins)
+
+                pygame.display.flip()
+
+                if not kernel_ready:
+                    # Stepping an empty system compiles (or loads) the numba
+                    # kernel now that the menu is on screen, instead of
+                    # stalling the first board frame
+                    balls.update()
+                    kernel_ready = True
+
+            if IS_WEB:
+                # Blocking would stall the browser, so keep polling there
+                events = pygame.event.get()
+            else:
+                # Sleep until the next event instead of spinning at FPS
+                events = [pygame.event.wait(100)] + pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     return
+                elif event.type == pygame.MOUSEMOTION:
+                    mouse_pos = event.pos
+                elif event.type == pygame.VIDEOEXPOSE:
+                    drawn_hover = None
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     for btn, m in mode_buttons:
                         if btn.clicked(event.pos):
@@ -260,35 +600,15 @@ async def main():
                     elif event.key == pygame.K_3:
                         mode = MODE_COMPETITION
 
-            screen.fill(BG_COLOR)
-
-            title = title_font.render("Boards of Destiny", True, WHITE)
-            screen.blit(title, (CENTER_X - title.get_width() // 2, 60))
-
-            prompt = font.render("Choose a mode:", True, WHITE)
-            screen.blit(prompt, (CENTER_X - prompt.get_width() // 2, 120))
-
-            for btn, m in mode_buttons:
-                btn.draw(screen, mouse_pos)
-                desc = small_font.render(mode_descs[m], True, DIM_TEXT_COLOR)
-                screen.blit(desc, (CENTER_X - desc.get_width() // 2, btn.rect.bottom + 6))
-
-            # Pixel art coins
-            coin_y = HEIGHT - 90
-            coin_r = 42
-            draw_pixel_coin(screen, CENTER_X - 80, coin_y, coin_r,
-                            "SUCCESS", (220, 190, 60), (170, 140, 30), (100, 75, 10))
-            draw_pixel_coin(screen, CENTER_X + 80, coin_y, coin_r,
-                            "FAILURE", (160, 170, 185), (100, 110, 125), (50, 55, 65))
-
-            pygame.display.flip()
             clock.tick(FPS)
             await asyncio.sleep(0)
 
         # --- Board state ---
-        active_balls = []
+        balls.reset()
         bin_counts = [0] * NUM_BINS
-        landed_positions = []
+        landed_surface.fill((0, 0, 0, 0))
+        label_surf.fill((0, 0, 0, 0))
+        shown_bin_counts = [0] * NUM_BINS
         spawn_timer = 0
         total_spawned = 0
         paused = False
@@ -305,6 +625,9 @@ async def main():
         }
         mode_label = mode_labels[mode]
         accent = mode_accents[mode]
+        mode_surf = font.render(f"Mode: {mode_label}", True, accent)
+        background.blit(board_bg, (0, 0))
+        background.blit(mode_surf, (CENTER_X - mode_surf.get_width() // 2, 52))
 
         # Control buttons during simulation
         ctrl_btn_w, ctrl_btn_h = 120, 39
@@ -314,12 +637,16 @@ async def main():
                            "Reset", btn_font)
 
         reset = False
+        drawn_state = None
         while not reset:
-            mouse_pos = pygame.mouse.get_pos()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     return
+                elif event.type == pygame.MOUSEMOTION:
+                    mouse_pos = event.pos
+                elif event.type == pygame.VIDEOEXPOSE:
+                    drawn_state = None
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     if btn_pause.clicked(event.pos):
                         paused = not paused
@@ -331,89 +658,111 @@ async def main():
                     elif event.key == pygame.K_SPACE:
                         paused = not paused
 
+            # Screen areas other than the falling balls that change this frame
+            changed = []
+
             if not paused:
                 spawn_timer += 1
                 if spawn_timer >= SPAWN_INTERVAL and total_spawned < MAX_BALLS:
                     spawn_timer = 0
-                    active_balls.append(Ball(mode, bin_counts))
+                    balls.spawn(mode, bin_counts)
                     total_spawned += 1
 
-                for ball in active_balls:
-                    ball.update()
-
-                still_active = []
-                for ball in active_balls:
-                    if ball.landed:
-                        b = ball.final_bin
-                        bin_counts[b] += 1
-                        bx = bin_center_x(b)
-                        by = BIN_BOTTOM - (bin_counts[b] - 1) * LANDED_BALL_STEP - LANDED_BALL_RADIUS
-                        landed_positions.append((bx, by, ball.color))
-                    else:
-                        still_active.append(ball)
-                active_balls = still_active
+                final_bin = balls.final_bin
+                color = balls.color
+                stamp = landed_surface.blit
+                for i in balls.update().tolist():
+                    b = final_bin[i]
+                    bin_counts[b] += 1
+                    x = BIN_CENTERS[b] - LANDED_BALL_RADIUS
+                    y = BIN_BOTTOM - (bin_counts[b] - 1) * LANDED_BALL_STEP - 2 * LANDED_BALL_RADIUS
+                    sprite = ball_sprite(color[i], LANDED_BALL_RADIUS)
+                    stamp(sprite, (x - left_x, y))
+                    changed.append(pygame.Rect((x, y), sprite.get_size()))
+
+                label_h = label_surf.get_height()
+                for i in range(NUM_BINS):
+                    count = bin_counts[i]
+                    if count != shown_bin_counts[i]:
+                        shown_bin_counts[i] = count
+                        label = render_text(str(count), small_font, DIM_TEXT_COLOR)
+                        x = BIN_CENTERS[i] - BIN_WIDTH // 2
+                        label_surf.fill((0, 0, 0, 0), (x, 0, BIN_WIDTH, label_h))
+                        label_surf.blit(label, (BIN_CENTERS[i] - label.get_width() // 2, 0))
+                        changed.append(pygame.Rect(x, BIN_BOTTOM + 8, BIN_WIDTH, label_h))
 
             # --- Draw ---
-            screen.fill(BG_COLOR)
-
-            # Title
-            title_surf = title_font.render("Boards of Destiny", True, WHITE)
-            screen.blit(title_surf, (CENTER_X - title_surf.get_width() // 2, 10))
-
-            # Mode label
-            mode_surf = font.render(f"Mode: {mode_label}", True, accent)
-            screen.blit(mode_surf, (CENTER_X - mode_surf.get_width() // 2, 52))
-
-            # Ball counter
-            counter = small_font.render(f"Balls: {total_spawned}/{MAX_BALLS}", True, DIM_TEXT_COLOR)
-            screen.blit(counter, (15, 84))
-
-            # Control buttons
-            btn_pause.text = "Resume" if paused else "Pause"
-            btn_pause.draw(screen, mouse_pos)
-            btn_reset.draw(screen, mouse_pos)
-
-            # Pegs
-            for (px, py) in pegs:
-                pygame.draw.circle(screen, PEG_COLOR, (int(px), int(py)), PEG_RADIUS)
-                pygame.draw.circle(screen, PEG_HIGHLIGHT, (int(px) - 1, int(py) - 1), max(1, PEG_RADIUS // 2))
-
-            # Bin dividers
-            for i in range(NUM_BINS + 1):
-                x = int(bin_center_x(0) - BIN_WIDTH / 2 + i * BIN_WIDTH)
-                pygame.draw.line(screen, BIN_BORDER_COLOR, (x, BIN_TOP), (x, BIN_BOTTOM), 2)
-
-            # Bin bottom
-            left_x = int(bin_center_x(0) - BIN_WIDTH / 2)
-            right_x = int(bin_center_x(NUM_BINS - 1) + BIN_WIDTH / 2)
-            pygame.draw.line(screen, BIN_BORDER_COLOR, (left_x, BIN_BOTTOM), (right_x, BIN_BOTTOM), 2)
-
-            # Bin labels
-            for i in range(NUM_BINS):
-                if bin_counts[i] > 0:
-                    label = small_font.render(str(bin_counts[i]), True, DIM_TEXT_COLOR)
-                    lx = int(bin_center_x(i)) - label.get_width() // 2
-                    screen.blit(label, (lx, BIN_BOTTOM + 8))
-
-            # Landed balls
-            for (bx, by, color) in landed_positions:
-                pygame.draw.circle(screen, color, (int(bx), int(by)), LANDED_BALL_RADIUS)
-
-            # Active balls
-            for ball in active_balls:
-                ball.draw(screen)
-
-            # Paused indicator
-            if paused:
-                pause_surf = title_font.render("PAUSED", True, (255, 255, 100))
-                screen.blit(pause_surf, (CENTER_X - pause_surf.get_width() // 2, HEIGHT // 2 - 30))
-
-            pygame.display.flip()
-            clock.tick(FPS)
+            draw_state = (paused, btn_pause.hovered(mouse_pos), btn_reset.hovered(mouse_pos))
+            if draw_state != drawn_state:
+                # Pausing, hovering a button or a new board: repaint everything
+                drawn_state = draw_state
+                screen.blit(background, (0, 0))
+
+                # Ball counter
+                counter = render_text(f"Balls: {total_spawned}/{MAX_BALLS}", small_font, DIM_TEXT_COLOR)
+                counter_rect = screen.blit(counter, (15, 84))
+                shown_spawned = total_spawned
+
+                # Control buttons
+                btn_pause.text = "Resume" if paused else "Pause"
+                btn_pause.draw(screen, mouse_pos)
+                btn_reset.draw(screen, mouse_pos)
+
+                # Bin labels
+                screen.blit(label_surf, (0, BIN_BOTTOM + 8))
+
+                # Landed balls
+                screen.blit(landed_surface, (left_x, 0))
+
+                # Active balls
+                ball_rects = balls.draw(screen)
+
+                # Paused indicator
+                if paused:
+                    screen.blit(pause_surf, (CENTER_X - pause_surf.get_width() // 2, HEIGHT // 2 - 30))
+
+                pygame.display.flip()
+            elif not paused:
+                # Otherwise only the balls, the counter and the bins they land in
+                # change: repaint those areas from the background layers and
+                # push just them to the display
+                dirty = ball_rects + changed
+                blit = screen.blit
+                label_y = -(BIN_BOTTOM + 8)
+                for rect in dirty:
+                    blit(background, rect, rect)
+                    blit(landed_surface, rect, rect.move(-left_x, 0))
+                    blit(label_surf, rect, rect.move(0, label_y))
+
+                if total_spawned != shown_spawned:
+                    screen.blit(background, counter_rect, counter_rect)
+                    dirty.append(counter_rect)
+                    counter = render_text(f"Balls: {total_spawned}/{MAX_BALLS}", small_font, DIM_TEXT_COLOR)
+                    counter_rect = screen.blit(counter, (15, 84))
+                    dirty.append(counter_rect)
+                    shown_spawned = total_spawned
+
+                ball_rects = balls.draw(screen)
+                dirty += ball_rects
+                if dirty:
+                    pygame.display.update(dirty)
+
+            # Once every ball has landed the board is as static as when paused
+            settled = total_spawned >= MAX_BALLS and not ball_rects
+            clock.tick(10 if paused or settled else FPS)
             await asyncio.sleep(0)
 
     pygame.quit()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if IS_WEB:
+        asyncio.run(main())
+    else:
+        # uvloop is an optional, faster event loop for the desktop build
+        try:
+            import uvloop
+        except ImportError:
+            asyncio.run(main())
+        else:
+            uvloop.run(main())